@@ -80,6 +80,7 @@ static PyObject *calculate_phonons(PyObject *self, PyObject *args) {
 
     // Other vars
     int n_cells;
+    int n_sc_ogs;
     int n_rqpts;
     int dmats_len;
     int modegs_len;
@@ -173,6 +174,7 @@ static PyObject *calculate_phonons(PyObject *self, PyObject *args) {
     sc_im_idx = (int*) PyArray_DATA(py_sc_im_idx);
     cell_ogs = (int*) PyArray_DATA(py_cell_ogs);
     n_cells = PyArray_DIMS(py_fc)[0];
+    n_sc_ogs = PyArray_DIMS(py_sc_ogs)[0];
     n_rqpts = PyArray_DIMS(py_rqpts)[0];
     n_split_qpts = PyArray_DIMS(py_split_idx)[0];
     dmats_len = PyArray_DIMS(py_dmats)[0];
@@ -199,7 +201,9 @@ static PyObject *calculate_phonons(PyObject *self, PyObject *args) {
     #pragma omp parallel
     {
         const bool calc_dmat_grad = (modegs_len > 0) ? true : false;
-        double *corr, *dmat_per_q, *dmat_grad;
+        double *corr, *dmat_per_q, *dmat_grad, *cell_phases, *sc_phases;
+        cell_phases = (double*) malloc(2*n_cells*sizeof(double));
+        sc_phases = (double*) malloc(2*n_sc_ogs*sizeof(double));
         if (dipole) {
             corr = (double*) malloc(dmat_elems*sizeof(double));
         }
@@ -230,9 +234,13 @@ static PyObject *calculate_phonons(PyObject *self, PyObject *args) {
             if (calc_dmat_grad) {
                 modeg = (modegs + q*3*n_atoms*6);
             }
-            calculate_dyn_mat_at_q(qpt, n_atoms, n_cells, max_ims, n_sc_ims,
-                sc_im_idx, cell_ogs, sc_ogs, fc, all_ogs_cart, calc_dmat_grad,
-                dmat, dmat_grad);
+            // Calculate phases for each cell and supercell image origin
+            // once, rather than for every ij displacement
+            calculate_phases(qpt, n_cells, cell_ogs, cell_phases);
+            calculate_phases(qpt, n_sc_ogs, sc_ogs, sc_phases);
+            calculate_dyn_mat_at_q(n_atoms, n_cells, max_ims, n_sc_ims,
+                sc_im_idx, cell_phases, sc_phases, fc, all_ogs_cart,
+                calc_dmat_grad, dmat, dmat_grad);
 
             if (dipole) {
                 calculate_dipole_correction(qpt, n_atoms, cell_vec, recip_vec,
@@ -270,6 +278,8 @@ static PyObject *calculate_phonons(PyObject *self, PyObject *args) {
                 calculate_mode_gradients(n_atoms, eval, dmat, dmat_grad, modeg);
             }
         }
+        free((void*)cell_phases);
+        free((void*)sc_phases);
         if (dipole) {
             free((void*)corr);
         }
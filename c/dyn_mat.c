@@ -10,18 +10,36 @@
 
 #define PI 3.14159265358979323846
 
-void calculate_dyn_mat_at_q(const double *qpt, const int n_atoms,
-    const int n_cells, const int max_images, const int *n_sc_images,
-    const int *sc_image_i, const int *cell_origins, const int *sc_origins,
-    const double *fc_mat, const double *all_origins_cart, const bool calc_dmat_grad,
+void calculate_phases(const double *qpt, const int n_ogs,
+    const int *origins, double *phases) {
+
+    int i, k;
+    double qdotr;
+
+    // Note: uses the e^-i(q.r) convention, see calculate_dyn_mat_at_q
+    for (i = 0; i < n_ogs; i++) {
+        qdotr = 0;
+        for (k = 0; k < 3; k++) {
+            qdotr += qpt[k]*origins[3*i + k];
+        }
+        phases[2*i] = cos(2*PI*qdotr);
+        phases[2*i + 1] = -sin(2*PI*qdotr);
+    }
+}
+
+void calculate_dyn_mat_at_q(const int n_atoms, const int n_cells,
+    const int max_images, const int *n_sc_images, const int *sc_image_i,
+    const double *cell_phases, const double *sc_phases, const double *fc_mat,
+    const double *all_origins_cart, const bool calc_dmat_grad,
     double *dyn_mat, double *dmat_grad) {
 
     int i, j, n, nc, k, sc, ii, jj, sc_img_idx, idx, idx_t;
-    double qdotr;
     double rcart;
-    double phase[2];
+    double rcart_tmp[2];
     double phase_sum[2];
+    double sc_phase_sum[2];
     double rcart_sum[6];
+    double sc_rcart_sum[6];
 
     // Note: C calculated dynamical matrix uses e^-i(q.r) convention, whereas
     // Python uses the e^i(q.r) convention. This differing convention is used
@@ -41,30 +59,37 @@ void calculate_dyn_mat_at_q(const double *qpt, const int n_atoms,
     for (i = 0; i < n_atoms; i++) {
         for (j = i; j < n_atoms; j++) {
             for (nc = 0; nc < n_cells; nc++){
-                memset(phase_sum, 0, 2*sizeof(double));
-                memset(rcart_sum, 0, 6*sizeof(double));
-                // Calculate and sum phases for all  images
+                memset(sc_phase_sum, 0, 2*sizeof(double));
+                memset(sc_rcart_sum, 0, 6*sizeof(double));
+                // Sum supercell image phases for all images. The phase
+                // of each image is the supercell image phase multiplied
+                // by the cell phase, so only multiply by the cell phase
+                // once after summing
                 for (n = 0; n < n_sc_images[nc*s_n[0] + i*s_n[1] + j]; n++) {
-                    qdotr = 0;
                     sc_img_idx = nc*s_i[0] + i*s_i[1] + j*s_i[2] + n;
                     sc = sc_image_i[sc_img_idx];
-                    for (k = 0; k < 3; k++){
-                        qdotr += qpt[k]*(sc_origins[3*sc + k] + cell_origins[3*nc + k]);
-                    }
-                    phase[0] = cos(2*PI*qdotr);
-                    phase[1] = -sin(2*PI*qdotr);
-                    phase_sum[0] += phase[0];
-                    phase_sum[1] += phase[1];
+                    sc_phase_sum[0] += sc_phases[2*sc];
+                    sc_phase_sum[1] += sc_phases[2*sc + 1];
                     if (calc_dmat_grad) {
                         for (k = 0; k < 3; k++){
                             // Note: use cos + isin phase as dyn mat gradients aren't passed
                             // to a Fortran lib so we need to use the e^i(q.r) convention
                             rcart = all_origins_cart[3*sc_img_idx + k];
-                            rcart_sum[2*k] += phase[1]*rcart; //Multiply phase by i: swap re and im
-                            rcart_sum[2*k + 1] += phase[0]*rcart;
+                            sc_rcart_sum[2*k] += sc_phases[2*sc]*rcart;
+                            sc_rcart_sum[2*k + 1] -= sc_phases[2*sc + 1]*rcart;
                         }
                     }
                 }
+                cmult(sc_phase_sum, (cell_phases + 2*nc), phase_sum);
+                if (calc_dmat_grad) {
+                    for (k = 0; k < 3; k++){
+                        cmult_conj((sc_rcart_sum + 2*k), (cell_phases + 2*nc),
+                                   rcart_tmp);
+                        //Multiply phase by i: swap re and im
+                        rcart_sum[2*k] = -rcart_tmp[1];
+                        rcart_sum[2*k + 1] = rcart_tmp[0];
+                    }
+                }
                 for (ii = 0; ii < 3; ii++){
                     for (jj = 0; jj < 3; jj++){
                         idx = (3*i+ii)*3*n_atoms + 3*j + jj;
@@ -401,27 +426,34 @@ void calculate_mode_gradients(const int n_atoms, const double *evals,
     int n_modes = 3*n_atoms;
     double evec_mult_tmp[2];
     double conj_tmp[2];
+    double modeg_sum[6];
     int mode_s = 2*3*n_atoms; //Eigenvector array stride
 
     for (n = 0; n < n_modes; n++) {
+        memset(modeg_sum, 0, 6*sizeof(double));
         for (i = 0; i < n_atoms; i++) {
             for (a = 0; a < 3; a++) {
                 for (j = 0; j < n_atoms; j++) {
                     for (b = 0; b < 3; b++) {
-
+                        // Eigenvector product is the same for each
+                        // Cartesian direction k
+                        cmult_conj((evecs + (n*mode_s + 6*j + 2*b)),
+                                   (evecs + (n*mode_s + 6*i + 2*a)),
+                                   evec_mult_tmp);
+                        grad_idx = 3*(3*i + a)*mode_s + 3*(6*j + 2*b);
                         for (k = 0; k < 3; k++) {
-                            cmult_conj((evecs + (n*mode_s + 6*j + 2*b)),
-                                       (evecs + (n*mode_s + 6*i + 2*a)),
-                                       evec_mult_tmp);
-                            grad_idx = 3*(3*i + a)*mode_s + 3*(6*j + 2*b) + 2*k;
-                            cmult((dmat_grad + grad_idx), evec_mult_tmp, conj_tmp);
-                            modeg[6*n + 2*k] += 0.5*conj_tmp[0]/evals[n];
-                            modeg[6*n + 2*k + 1] += 0.5*conj_tmp[1]/evals[n];
+                            cmult((dmat_grad + grad_idx + 2*k), evec_mult_tmp,
+                                  conj_tmp);
+                            modeg_sum[2*k] += conj_tmp[0];
+                            modeg_sum[2*k + 1] += conj_tmp[1];
                         }
                     }
                 }
             }
         }
+        for (k = 0; k < 6; k++) {
+            modeg[6*n + k] += 0.5*modeg_sum[k]/evals[n];
+        }
     }
 }
 
@@ -1,11 +1,14 @@
 #ifndef __dyn_mat_H__
 #define __dyn_mat_H__
 
-void calculate_dyn_mat_at_q(const double *qpt, const int n_atoms,
-    const int n_cells, const int max_ims, const int *n_sc_images,
-    const int *sc_image_i, const int *cell_origins, const int *sc_origins,
-    const double *fc_mat, const double *all_origins_cart,
-    const bool calc_dmat_grad, double *dyn_mat, double *dmat_grad);
+void calculate_phases(const double *qpt, const int n_ogs,
+    const int *origins, double *phases);
+
+void calculate_dyn_mat_at_q(const int n_atoms, const int n_cells,
+    const int max_ims, const int *n_sc_images, const int *sc_image_i,
+    const double *cell_phases, const double *sc_phases, const double *fc_mat,
+    const double *all_origins_cart, const bool calc_dmat_grad,
+    double *dyn_mat, double *dmat_grad);
 
 void calculate_dipole_correction(const double *qpt, const int n_atoms,
     const double *cell_vec, const double *recip, const double *atom_r,
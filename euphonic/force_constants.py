@@ -96,11 +96,13 @@ class ForceConstants:
             [(n_sc, 3*n_at, 3*n_at), (n_sc, 3), (n_at, 3, 3), (3, 3)],
             ['force_constants', 'cell_origins', 'born', 'dielectric'])
         self.crystal = crystal
-        self._force_constants = force_constants.to(
-            'hartree/bohr**2').magnitude
+        # Ensure arrays are C-contiguous on input, so later reshapes
+        # are views rather than hidden copies
+        self._force_constants = np.ascontiguousarray(force_constants.to(
+            'hartree/bohr**2').magnitude)
         self.force_constants_unit = str(force_constants.units)
         self.sc_matrix = sc_matrix
-        self.cell_origins = cell_origins
+        self.cell_origins = np.ascontiguousarray(cell_origins)
         self.n_cells_in_sc = n_sc
 
         if born is not None:
@@ -125,7 +127,13 @@ class ForceConstants:
     @force_constants.setter
     def force_constants(self, value: Quantity) -> None:
         self.force_constants_unit = str(value.units)
-        self._force_constants = value.to('hartree/bohr**2').magnitude
+        self._force_constants = np.ascontiguousarray(
+            value.to('hartree/bohr**2').magnitude)
+        # Remove any stored values calculated from the old matrix
+        for attr in ['_force_constants_asr', '_fc_img_weighted',
+                     '_fc_img_blocks']:
+            if hasattr(self, attr):
+                delattr(self, attr)
 
     @property
     def born(self) -> Union[Quantity, None]:
@@ -606,24 +614,61 @@ class ForceConstants:
                        dipole_parameter != self._dipole_parameter):
             self._dipole_correction_init(dipole_parameter)
 
-        force_constants = self._force_constants
-        if asr == 'realspace':
-            if not hasattr(self, '_force_constants_asr'):
-                self._force_constants_asr = self._enforce_realspace_asr()
-            force_constants = self._force_constants_asr
-        # Precompute fc matrix weighted by number of supercell atom
-        # images (for cumulant method)
-        n_sc_images_repeat = (
-            self._n_sc_images.repeat(3, axis=2).repeat(3, axis=1))
-        fc_img_weighted = np.divide(
-            force_constants, n_sc_images_repeat, where=n_sc_images_repeat != 0)
+        euphonic_path = os.path.dirname(euphonic.__file__)
+        cext_err_msg = (f'Euphonic\'s C extension couldn\'t be imported '
+                        f'from {euphonic_path}, it may not have been '
+                        f'installed.')
+
+        # Check if C extension can be used and handle appropriately
+        use_c_status = False
+        if use_c is not False:
+            try:
+                import euphonic._euphonic as euphonic_c
+                use_c_status = True
+            except ImportError:
+                if use_c is None:
+                    warnings.warn((
+                        cext_err_msg
+                        + ' Falling back to pure Python calculation.'),
+                        stacklevel=3)
+                else:
+                    raise ImportCError(cext_err_msg)
+
+        # The image weighted fc matrices only depend on the force
+        # constants and supercell images, so only calculate them once
+        # each for the uncorrected and realspace ASR corrected matrix
+        realspace_asr = (asr == 'realspace')
+        if not hasattr(self, '_fc_img_weighted'):
+            self._fc_img_weighted = {}
+        if realspace_asr not in self._fc_img_weighted:
+            force_constants = self._force_constants
+            if realspace_asr:
+                if not hasattr(self, '_force_constants_asr'):
+                    self._force_constants_asr = self._enforce_realspace_asr()
+                force_constants = self._force_constants_asr
+            self._fc_img_weighted[realspace_asr] = (
+                self._calculate_fc_img_weighted(force_constants))
+        fc_img_weighted = self._fc_img_weighted[realspace_asr]
+        # The 3 x 3 block layout is only used by the Python calculation,
+        # so only store it if that will be used. Otherwise only create
+        # it temporarily if needed for the reciprocal ASR correction
+        fc_img_blocks = None
+        if not use_c_status:
+            if not hasattr(self, '_fc_img_blocks'):
+                self._fc_img_blocks = {}
+            if realspace_asr not in self._fc_img_blocks:
+                self._fc_img_blocks[realspace_asr] = (
+                    self._get_fc_img_blocks(fc_img_weighted))
+            fc_img_blocks = self._fc_img_blocks[realspace_asr]
+        elif asr == 'reciprocal':
+            fc_img_blocks = self._get_fc_img_blocks(fc_img_weighted)
 
         recip_asr_correction = np.array([], dtype=np.complex128)
         if asr == 'reciprocal':
             # Calculate dyn mat at gamma for reciprocal ASR
             q_gamma = np.array([0., 0., 0.])
             dyn_mat_gamma, _ = self._calculate_dyn_mat(
-                q_gamma, fc_img_weighted, unique_sc_origins,
+                q_gamma, fc_img_blocks, unique_sc_origins,
                 unique_sc_i, unique_cell_origins, unique_cell_i,
                 all_origins_cart)
             if dipole:
@@ -647,26 +692,6 @@ class ForceConstants:
         else:
             rmode_gradients = np.zeros((0, 3*n_atoms, 3), dtype=np.complex128)
 
-        euphonic_path = os.path.dirname(euphonic.__file__)
-        cext_err_msg = (f'Euphonic\'s C extension couldn\'t be imported '
-                        f'from {euphonic_path}, it may not have been '
-                        f'installed.')
-
-        # Check if C extension can be used and handle appropriately
-        use_c_status = False
-        if use_c is not False:
-            try:
-                import euphonic._euphonic as euphonic_c
-                use_c_status = True
-            except ImportError:
-                if use_c is None:
-                    warnings.warn((
-                        cext_err_msg
-                        + ' Falling back to pure Python calculation.'),
-                        stacklevel=3)
-                else:
-                    raise ImportCError(cext_err_msg)
-
         if use_c_status is True:
             if n_threads is None:
                 n_threads_env = os.environ.get(
@@ -706,19 +731,28 @@ class ForceConstants:
                     splitting, rfreqs, reigenvecs, rmode_gradients,
                     all_origins_cart, n_threads)
         else:
-            for qi, qpt in enumerate(reduced_qpts):
-                q_dir = None
-                if splitting and is_gamma(qpt):
-                    q_dir_idx = np.where(split_idx == qi)[0][0]
-                    q_dir = q_dirs[q_dir_idx]
-                rfreqs[qi], evecs, grads = self._calculate_phonons_at_q(
-                    qpt, fc_img_weighted, unique_sc_origins, unique_sc_i,
-                    unique_cell_origins, unique_cell_i, all_origins_cart,
-                    dyn_mat_weighting, recip_asr_correction, dipole, q_dir)
+            rq_dirs = [None]*n_rqpts
+            for q_dir_idx, qi in enumerate(split_idx):
+                rq_dirs[qi] = q_dirs[q_dir_idx]
+            # Diagonalise dynamical matrices for several q-points at
+            # once to reduce per-q overhead, but do in chunks to limit
+            # the memory required to store them and their gradients.
+            # Each chunk holds at most ~2**21 dynamical matrix elements
+            # (~130 MB including gradients) so large cells use fewer
+            # q-points per chunk
+            chunk = max(1, min(100, int(2**21/(3*n_atoms)**2)))
+            for i in range(int((n_rqpts - 1)/chunk) + 1):
+                qi = i*chunk
+                qf = min((i + 1)*chunk, n_rqpts)
+                rfreqs[qi:qf], evecs, grads = self._calculate_phonons_batch(
+                    reduced_qpts[qi:qf], fc_img_blocks, unique_sc_origins,
+                    unique_sc_i, unique_cell_origins, unique_cell_i,
+                    all_origins_cart, dyn_mat_weighting,
+                    recip_asr_correction, dipole, rq_dirs[qi:qf])
                 if return_eigenvectors:
-                    reigenvecs[qi] = evecs
+                    reigenvecs[qi:qf] = evecs
                 if return_mode_gradients:
-                    rmode_gradients[qi] = grads
+                    rmode_gradients[qi:qf] = grads
 
         freqs = rfreqs[qpts_i]*ureg('hartree').to('meV')
         if return_eigenvectors:
@@ -751,10 +785,10 @@ class ForceConstants:
                 self.crystal.cell_vectors)
         return qpts, freqs, weights, eigenvectors, mode_gradients
 
-    def _calculate_phonons_at_q(
+    def _calculate_phonons_batch(
             self,
-            qpt: np.ndarray,
-            fc_img_weighted: np.ndarray,
+            qpts: np.ndarray,
+            fc_img_blocks: np.ndarray,
             unique_sc_origins: Sequence[Sequence[int]],
             unique_sc_i: np.ndarray,
             unique_cell_origins: Sequence[Sequence[int]],
@@ -763,21 +797,22 @@ class ForceConstants:
             dyn_mat_weighting: np.ndarray,
             recip_asr_correction: np.ndarray,
             dipole: bool,
-            q_dir: Optional[np.ndarray] = None
+            q_dirs: Sequence[Optional[np.ndarray]]
             ) -> Tuple[np.ndarray, np.ndarray, Union[np.ndarray, None]]:
         """
-        Given a q-point and some precalculated q-independent values,
-        calculate and diagonalise the dynamical matrix and return the
+        Given some q-points and some precalculated q-independent values,
+        calculate and diagonalise the dynamical matrices and return the
         frequencies, eigenvectors and optionally mode gradients
 
         Parameters
         ----------
-        qpt
-            Shape (3,) float ndarray. The q-point to calculate
-        fc_img_weighted
-            Shape (n_cells_in_sc, 3*n_atoms, 3*n_atoms) float ndarray.
+        qpts
+            Shape (n_qpts, 3) float ndarray. The q-points to calculate
+        fc_img_blocks
+            Shape (n_atoms, n_atoms, n_cells_in_sc, 9) complex ndarray.
             The force constants matrix weighted by the number of
-            supercell atom images for each ij displacement
+            supercell atom images, stored as a flattened 3 x 3 block
+            for each ij displacement and cell
         unique_sc_origins
             A list containing 3 lists of the unique supercell image
             offsets in each direction. The supercell offset is
@@ -813,58 +848,78 @@ class ForceConstants:
             only used if the reciprocal ASR was requested
         dipole
             Whether to apply the dipole correction
-        q_dir
-            Shape (3,) float ndarray, the q-direction to use in LO-TO
-            splitting, if applicable
+        q_dirs
+            Length n_qpts sequence of shape (3,) float ndarray or None.
+            The q-direction to use in LO-TO splitting at each q-point,
+            if applicable
 
         Returns
         -------
         frequencies
-            Shape (3*n_atoms) float ndarray. The phonon frequencies
+            Shape (n_qpts, 3*n_atoms) float ndarray. The phonon
+            frequencies
         eigenvectors
-            Shape (3*n_atoms, n_atoms, 3) complex ndarray. The
+            Shape (n_qpts, 3*n_atoms, n_atoms, 3) complex ndarray. The
             eigenvectors
         mode_gradients
-            Shape (3*n_atoms, 3) complex ndarray. The gradient for
-            each mode
+            Shape (n_qpts, 3*n_atoms, 3) complex ndarray. The gradient
+            for each mode
         """
         n_atoms = self.crystal.n_atoms
+        n_qpts = len(qpts)
+        n_modes = 3*n_atoms
 
-        dyn_mat, dmat_grad = self._calculate_dyn_mat(
-            qpt, fc_img_weighted, unique_sc_origins, unique_sc_i,
-            unique_cell_origins, unique_cell_i, all_origins_cart)
-
-        if dipole:
-            dipole_corr = self._calculate_dipole_correction(qpt)
-            dyn_mat += dipole_corr
-
-        if len(recip_asr_correction) > 0:
-            dyn_mat += recip_asr_correction
-
-        # Calculate LO-TO splitting by calculating non-analytic
-        # correction to dynamical matrix
-        if q_dir is not None:
-            dyn_mat += self._calculate_gamma_correction(q_dir)
-
-        # Mass weight dynamical matrix
-        dyn_mat *= dyn_mat_weighting
+        dyn_mats = np.zeros((n_qpts, n_modes, n_modes), dtype=np.complex128)
+        if len(all_origins_cart) > 0:
+            dmat_grads = np.zeros((n_qpts, n_modes, n_modes, 3),
+                                  dtype=np.complex128)
+        else:
+            dmat_grads = None
+        for qi, qpt in enumerate(qpts):
+            dyn_mat, dmat_grad = self._calculate_dyn_mat(
+                qpt, fc_img_blocks, unique_sc_origins, unique_sc_i,
+                unique_cell_origins, unique_cell_i, all_origins_cart)
 
-        evals, evecs = np.linalg.eigh(dyn_mat, UPLO='U')
-        evecs = np.reshape(np.transpose(evecs),
-                           (3*n_atoms, n_atoms, 3))
-        # Set imaginary frequencies to negative
-        imag_freqs = np.where(evals < 0)
-        evals = np.sqrt(np.abs(evals))
-        evals[imag_freqs] *= -1
-
-        if dmat_grad is not None:
-            n_modes = len(evecs)
-            dmat_grad *= dyn_mat_weighting[..., np.newaxis]
-            evecs_sq_view = np.reshape(evecs, (n_modes, n_modes))
+            if dipole:
+                dipole_corr = self._calculate_dipole_correction(qpt)
+                dyn_mat += dipole_corr
+
+            if len(recip_asr_correction) > 0:
+                dyn_mat += recip_asr_correction
+
+            # Calculate LO-TO splitting by calculating non-analytic
+            # correction to dynamical matrix
+            if q_dirs[qi] is not None:
+                dyn_mat += self._calculate_gamma_correction(q_dirs[qi])
+
+            dyn_mats[qi] = dyn_mat
+            if dmat_grads is not None:
+                dmat_grads[qi] = dmat_grad
+
+        # Mass weight dynamical matrices
+        dyn_mats *= dyn_mat_weighting
+
+        # Diagonalise all dynamical matrices in a single call
+        evals, evecs = np.linalg.eigh(dyn_mats, UPLO='U')
+        evecs = np.reshape(np.transpose(evecs, axes=[0, 2, 1]),
+                           (n_qpts, n_modes, n_atoms, 3))
+        # Set imaginary frequencies to negative in a single vectorised
+        # operation over all q-points, as is done in C
+        evals = np.copysign(np.sqrt(np.abs(evals)), evals)
+
+        if dmat_grads is not None:
+            dmat_grads *= dyn_mat_weighting[..., np.newaxis]
+            evecs_sq_view = np.reshape(evecs, (n_qpts, n_modes, n_modes))
+            # The gradient of mode i in direction l is
+            # conj(e_i).dD/dq_l.e_i. Calculate dD/dq_l.e_i for all
+            # q-points, directions and modes with a batched matrix
+            # product, then contract with conj(e_i)
+            dmat_grads_evecs = np.matmul(
+                np.transpose(dmat_grads, axes=[0, 3, 1, 2]),
+                np.transpose(evecs_sq_view, axes=[0, 2, 1])[:, np.newaxis])
             mode_grads_xyz = np.einsum(
-                'ij,ik,jkl->il', np.conj(evecs_sq_view),
-                                 evecs_sq_view,
-                                 dmat_grad)/(2*evals[:, np.newaxis])
+                'qij,qlji->qil', np.conj(evecs_sq_view),
+                dmat_grads_evecs)/(2*evals[..., np.newaxis])
             return evals, evecs, mode_grads_xyz
         else:
             return evals, evecs, None
@@ -872,7 +927,7 @@ class ForceConstants:
     def _calculate_dyn_mat(
             self,
             qpt: np.ndarray,
-            fc_img_weighted: np.ndarray,
+            fc_img_blocks: np.ndarray,
             unique_sc_origins: Sequence[Sequence[int]],
             unique_sc_i: np.ndarray,
             unique_cell_origins: Sequence[Sequence[int]],
@@ -889,10 +944,11 @@ class ForceConstants:
         ----------
         qpt
             Shape (3,) float ndarray. The q-point to calculate
-        fc_img_weighted
-            Shape (n_cells_in_sc, 3*n_atoms, 3*n_atoms) float ndarray.
+        fc_img_blocks
+            Shape (n_atoms, n_atoms, n_cells_in_sc, 9) complex ndarray.
             The force constants matrix weighted by the number of
-            supercell atom images for each ij displacement
+            supercell atom images, stored as a flattened 3 x 3 block
+            for each ij displacement and cell
         unique_sc_origins
             A list containing 3 lists of the unique supercell image
             offsets in each direction. The supercell offset is
@@ -944,22 +1000,32 @@ class ForceConstants:
         sc_phases[:-1], cell_phases = self._calculate_phases(
             qpt, unique_sc_origins, unique_sc_i, unique_cell_origins,
             unique_cell_i)
-        sc_phase_sum = np.sum(sc_phases[sc_image_i],
-                              axis=3)
+        sc_image_phases = sc_phases[sc_image_i]
+        sc_phase_sum = np.sum(sc_image_phases, axis=3)
 
         ax = np.newaxis
+        n_atoms = sc_phase_sum.shape[1]
         ij_phases = cell_phases[:, ax, ax]*sc_phase_sum
-        full_dyn_mat = fc_img_weighted*(
-            ij_phases.repeat(3, axis=2).repeat(3, axis=1))
-        dyn_mat = np.sum(full_dyn_mat, axis=0)
+        # Multiply phases into the 3 x 3 fc block for each ij
+        # displacement without repeating them for each Cartesian
+        # direction, then sum over cells
+        dyn_mat = np.einsum('ijk,jkix->jkx', ij_phases, fc_img_blocks)
+        dyn_mat = np.reshape(np.transpose(
+            np.reshape(dyn_mat, (n_atoms, n_atoms, 3, 3)),
+            axes=[0, 2, 1, 3]), (3*n_atoms, 3*n_atoms))
         if len(all_origins_cart) > 0:
-            all_phases = np.einsum('ijkl,i->ijkl',
-                                   sc_phases[sc_image_i], cell_phases)
-            r_vec_sum = 1j*np.einsum('ijkl,ijklm->ijkm',
-                                     all_phases, all_origins_cart)
-            dmat_gradient = fc_img_weighted[..., ax]*(r_vec_sum.repeat(
-                3, axis=2).repeat(3, axis=1))
-            dmat_gradient = np.sum(dmat_gradient, axis=0)
+            all_phases = cell_phases[:, ax, ax, ax]*sc_image_phases
+            # Sum over images for each ij with a (1, n_images) x
+            # (n_images, 3) matrix product
+            r_vec_sum = 1j*np.matmul(all_phases[:, :, :, ax, :],
+                                     all_origins_cart)[:, :, :, 0, :]
+            # Sum over cells for each ij with a (3, n_cells) x
+            # (n_cells, 9) matrix product
+            dmat_gradient = np.matmul(
+                np.transpose(r_vec_sum, axes=[1, 2, 3, 0]), fc_img_blocks)
+            dmat_gradient = np.reshape(np.transpose(
+                np.reshape(dmat_gradient, (n_atoms, n_atoms, 3, 3, 3)),
+                axes=[0, 3, 1, 4, 2]), (3*n_atoms, 3*n_atoms, 3))
             return dyn_mat, dmat_gradient
         else:
             return dyn_mat, None
@@ -1046,8 +1112,10 @@ class ForceConstants:
             else:
                 break
         # Use compact H_ab to fill in upper triangular of realspace term
-        real_q0[np.triu_indices(n_atoms)] = np.sum(H_ab, axis=0)
-        real_q0 *= upper_lambda**3/math.sqrt(np.linalg.det(dielectric))
+        idx_u = np.triu_indices(n_atoms)
+        real_q0[idx_u] = np.sum(H_ab, axis=0)
+        real_factor = upper_lambda**3/math.sqrt(np.linalg.det(dielectric))
+        real_q0 *= real_factor
 
         # Calculate the q=0 reciprocal term
         recip_q0 = np.zeros((n_atoms, n_atoms, 3, 3), dtype=np.complex128)
@@ -1082,7 +1150,8 @@ class ForceConstants:
             else:
                 break
         vol = self.crystal._cell_volume()
-        recip_q0 *= math.pi/(vol*lambda_2)
+        recip_factor = math.pi/(vol*lambda_2)
+        recip_q0 *= recip_factor
 
         # Fill in remaining entries by symmetry
         for i in range(1, n_atoms):
@@ -1092,16 +1161,10 @@ class ForceConstants:
 
         # Calculate the q=0 correction, to be subtracted from the
         # corrected diagonal at each q
-        dipole_q0 = np.zeros((n_atoms, 3, 3), dtype=np.complex128)
-        for i in range(n_atoms):
-            for j in range(n_atoms):
-                for a in range(3):
-                    for b in range(3):
-                        dipole_q0[i, a, b] += np.sum(
-                            np.einsum('i,j', born[i, a, :], born[j, b, :])
-                            *(recip_q0[i, j] - real_q0[i, j]))
-            # Symmetrise 3x3
-            dipole_q0[i] = 0.5*(dipole_q0[i] + np.transpose(dipole_q0[i]))
+        dipole_q0 = np.einsum('iac,jbd,ijcd->iab', born, born,
+                              recip_q0 - real_q0, optimize=True)
+        # Symmetrise 3x3
+        dipole_q0 = 0.5*(dipole_q0 + np.transpose(dipole_q0, axes=[0, 2, 1]))
 
         self._dipole_parameter = dipole_parameter
         self._lambda = upper_lambda
@@ -1110,6 +1173,12 @@ class ForceConstants:
         self._gvecs_cart = gvecs_cart
         self._gvec_phases = gvec_phases
         self._dipole_q0 = dipole_q0
+        # Also store q-independent values that would otherwise be
+        # recalculated at every q-point
+        self._dipole_recip = recip
+        self._dipole_real_factor = real_factor
+        self._dipole_recip_factor = recip_factor
+        self._dipole_idx_u = idx_u
 
     def _calculate_dipole_correction(self, q: np.ndarray) -> np.ndarray:
         """
@@ -1129,16 +1198,18 @@ class ForceConstants:
             Shape (3*n_atoms, 3*n_atoms) complex ndarray. The
             correction to the dynamical matrix
         """
-        recip = self.crystal.reciprocal_cell().to('1/bohr').magnitude
+        recip = self._dipole_recip
         n_atoms = self.crystal.n_atoms
         atom_r = self.crystal.atom_r
         born = self._born
         dielectric = self._dielectric
-        upper_lambda = self._lambda
-        lambda_2 = upper_lambda**2
+        lambda_2 = self._lambda**2
         H_ab = self._H_ab
         cells = self._cells
         q_norm = q - np.rint(q)  # Normalised q-pt
+        # The correction is Hermitian, so only calculate the upper
+        # triangular ij pairs and fill in the rest by symmetry
+        idx_u = self._dipole_idx_u
 
         # Don't include G=0 vector if q=0
         if is_gamma(q_norm):
@@ -1149,17 +1220,13 @@ class ForceConstants:
             gvecs_cart = self._gvecs_cart
 
         # Calculate real space term
-        real_dipole = np.zeros((n_atoms, n_atoms, 3, 3), dtype=np.complex128)
         # Calculate real space phase factor
         q_dot_ra = np.einsum('i,ji->j', q_norm, cells)
         real_phases = np.exp(2j*math.pi*q_dot_ra)
-        real_dipole_tmp = np.einsum('i,ijkl->jkl', real_phases, H_ab)
-        idx_u = np.triu_indices(n_atoms)
-        real_dipole[idx_u] = real_dipole_tmp
-        real_dipole *= upper_lambda**3/math.sqrt(np.linalg.det(dielectric))
+        real_dipole = np.einsum('i,ijkl->jkl', real_phases, H_ab)
+        real_dipole *= self._dipole_real_factor
 
         # Calculate reciprocal term
-        recip_dipole = np.zeros((n_atoms, n_atoms, 3, 3), dtype=np.complex128)
         # Calculate q-point phases
         q_dot_r = np.einsum('i,ji->j', q_norm, atom_r)
         q_phases = np.exp(2j*math.pi*q_dot_r)
@@ -1169,29 +1236,28 @@ class ForceConstants:
         kvecs_ab = np.einsum('ij,ik->ijk', kvecs, kvecs)
         k_len_2 = np.einsum('ijk,jk->i', kvecs_ab, dielectric)/(4*lambda_2)
         recip_exp = np.einsum('ijk,i->ijk', kvecs_ab, np.exp(-k_len_2)/k_len_2)
-        for i in range(n_atoms):
-                phase_exp = ((gvec_phases[:, i, None]*q_phases[i])
-                             /(gvec_phases[:, i:]*q_phases[i:]))
-                recip_dipole[i, i:] = np.einsum(
-                    'ikl,ij->jkl', recip_exp, phase_exp)
-        cell_volume = self.crystal._cell_volume()
-        recip_dipole *= math.pi/(cell_volume*lambda_2)
-
-        # Fill in remaining entries by symmetry
-        # Mask so we don't count diagonal twice
-        mask = np.tri(n_atoms, k=-1)[:, :, np.newaxis, np.newaxis]
-        real_dipole = real_dipole + mask*np.conj(
-            np.transpose(real_dipole, axes=[1, 0, 2, 3]))
-        recip_dipole = recip_dipole + mask*np.conj(
-            np.transpose(recip_dipole, axes=[1, 0, 2, 3]))
+        # Phase for each G-vector and ij pair is gq_phases[i]/gq_phases[j]
+        # so calculate for all ij pairs at once rather than looping over
+        # i. As all phases have unit modulus, dividing by gq_phases[j] is
+        # the same as multiplying by its conjugate, which avoids a
+        # complex division for every element
+        gq_phases = gvec_phases*q_phases
+        phase_exp = gq_phases[:, idx_u[0]]*np.conj(gq_phases[:, idx_u[1]])
+        recip_dipole = np.tensordot(phase_exp, recip_exp, axes=(0, 0))
+        recip_dipole *= self._dipole_recip_factor
 
         # Multiply by Born charges and subtract q=0 from diagonal
         dipole = np.zeros((n_atoms, n_atoms, 3, 3), dtype=np.complex128)
-        dipole_tmp = recip_dipole - real_dipole
-        for i in range(n_atoms):
-            dipole[i] = np.einsum('ij,klm,kjm->kil',
-                                  born[i], born, dipole_tmp[i])
-            dipole[i, i] -= self._dipole_q0[i]
+        dipole[idx_u] = np.einsum('iac,ibd,icd->iab',
+                                  born[idx_u[0]], born[idx_u[1]],
+                                  recip_dipole - real_dipole)
+        diag_idx = np.diag_indices(n_atoms)
+        dipole[diag_idx] -= self._dipole_q0
+
+        # Fill in lower triangle by symmetry, excluding diagonal blocks
+        off_diag = idx_u[0] != idx_u[1]
+        dipole[idx_u[1][off_diag], idx_u[0][off_diag]] = np.conj(
+            np.transpose(dipole[idx_u][off_diag], axes=[0, 2, 1]))
 
         return np.reshape(np.transpose(dipole, axes=[0, 2, 1, 3]),
                           (3*n_atoms, 3*n_atoms))
@@ -1324,6 +1390,66 @@ class ForceConstants:
 
         return origins
 
+    def _calculate_fc_img_weighted(
+            self, force_constants: np.ndarray) -> np.ndarray:
+        """
+        Weight the force constants matrix by the number of supercell
+        atom images for each ij displacement (for the cumulant method)
+
+        Parameters
+        ----------
+        force_constants
+            Shape (n_cells_in_sc, 3*n_atoms, 3*n_atoms) float ndarray.
+            The force constants matrix to weight
+
+        Returns
+        -------
+        fc_img_weighted
+            Shape (n_cells_in_sc, 3*n_atoms, 3*n_atoms) float ndarray.
+            The image weighted force constants matrix
+        """
+        n_cells_in_sc = self.n_cells_in_sc
+        n_atoms = self.crystal.n_atoms
+        n_sc_images = self._n_sc_images
+        # Multiply by the inverse number of images for each ij
+        # displacement, which is zero where there are no images,
+        # broadcast over each 3 x 3 block
+        inv_n_sc_images = np.divide(
+            1., n_sc_images, out=np.zeros(n_sc_images.shape),
+            where=n_sc_images != 0)
+        fc_blocks = (np.reshape(force_constants,
+                                (n_cells_in_sc, n_atoms, 3, n_atoms, 3))
+                     *inv_n_sc_images[:, :, np.newaxis, :, np.newaxis])
+        return np.reshape(fc_blocks, (n_cells_in_sc, 3*n_atoms, 3*n_atoms))
+
+    def _get_fc_img_blocks(self, fc_img_weighted: np.ndarray) -> np.ndarray:
+        """
+        Reorder the image weighted force constants matrix for the Python
+        calculation so the 3 x 3 blocks for each ij displacement are
+        contiguous over supercell cells. Store as complex so it isn't
+        cast each time it is multiplied by the phases
+
+        Parameters
+        ----------
+        fc_img_weighted
+            Shape (n_cells_in_sc, 3*n_atoms, 3*n_atoms) float ndarray.
+            The image weighted force constants matrix
+
+        Returns
+        -------
+        fc_img_blocks
+            Shape (n_atoms, n_atoms, n_cells_in_sc, 9) complex ndarray.
+            The image weighted force constants matrix, stored as a
+            flattened 3 x 3 block for each ij displacement and cell
+        """
+        n_cells_in_sc = self.n_cells_in_sc
+        n_atoms = self.crystal.n_atoms
+        fc_blocks = np.reshape(fc_img_weighted,
+                               (n_cells_in_sc, n_atoms, 3, n_atoms, 3))
+        return np.reshape(np.ascontiguousarray(
+            np.transpose(fc_blocks, axes=[1, 3, 0, 2, 4]),
+            dtype=np.complex128), (n_atoms, n_atoms, n_cells_in_sc, 9))
+
     def _enforce_realspace_asr(self) -> np.ndarray:
         """
         Apply a transformation to the force constants matrix so that it
@@ -1557,17 +1683,16 @@ class ForceConstants:
         cutoff_scale = 1.0
 
         # Calculate points of WS cell for this supercell
-        sc_vecs = np.einsum('ji,ik->jk', sc_matrix, cell_vectors)
-        ws_list = np.einsum('ij,jk->ik', ws_frac, sc_vecs)
+        sc_vecs = np.matmul(sc_matrix, cell_vectors)
+        ws_list = np.matmul(ws_frac, sc_vecs)
         inv_ws_sq = 1.0/np.sum(np.square(ws_list[1:]), axis=1)
         ws_list_norm = ws_list[1:]*inv_ws_sq[:, ax]
 
         # Get Cartesian coords of supercell images and ions in supercell
         sc_image_r = get_all_origins(
             np.repeat(n_sc_shells, 3) + 1, min_xyz=-np.repeat(n_sc_shells, 3))
-        sc_image_cart = np.einsum('ij,jk->ik', sc_image_r, sc_vecs)
-        sc_atom_cart = np.einsum('ijk,kl->ijl',
-                                 cell_origins[:, ax, :] + atom_r[ax, :, :],
+        sc_image_cart = np.matmul(sc_image_r, sc_vecs)
+        sc_atom_cart = np.matmul(cell_origins[:, ax, :] + atom_r[ax, :, :],
                                  cell_vectors)
 
         sc_image_i = np.full(
@@ -1576,44 +1701,47 @@ class ForceConstants:
         n_sc_images = np.zeros((n_cells_in_sc, n_atoms, n_atoms),
                                dtype=np.int32)
 
-        # Ordering of loops here is for efficiency:
-        # ions in unit cell -> periodic supercell images -> WS points
-        # This is so the ion-ion vectors in each loop will be similar,
-        # so they are more likely to pass/fail the WS check together
-        # so the last loop can be broken early
+        # Test the vectors between each ion in the unit cell and all
+        # periodic supercell images of all ions in the supercell against
+        # all WS points at once. Use a (3, n_vecs) layout so each WS point
+        # projection is contiguous, but test the images in chunks to
+        # limit memory use for large supercells
+        n_rij = n_cells_in_sc*n_atoms
+        n_images = len(sc_image_cart)
+        chunk = max(1, int(8192/n_rij))
+        # Supercell and atom index of each flattened ij displacement
+        rij_idx = np.arange(n_rij)
+        nc_of_rij = rij_idx//n_atoms
+        j_of_rij = rij_idx % n_atoms
         for i in range(n_atoms):
-            rij = sc_atom_cart[0, i] - sc_atom_cart
-            for im, sc_r in enumerate(sc_image_cart):
+            rij = np.ascontiguousarray(np.transpose(
+                np.reshape(sc_atom_cart[0, i] - sc_atom_cart, (n_rij, 3))))
+            n_rij_images = np.zeros(n_rij, dtype=np.int32)
+            for ci in range(int((n_images - 1)/chunk) + 1):
+                imi = ci*chunk
+                imf = min((ci + 1)*chunk, n_images)
+                sc_r = np.ascontiguousarray(
+                    np.transpose(sc_image_cart[imi:imf]))
                 # Get vector between j in sc image and i in unit cell
-                dists = rij - sc_r
+                dists = np.reshape(rij[:, ax, :] - sc_r[:, :, ax], (3, -1))
                 # Only want to include images where ion < halfway to ALL
                 # ws points, so compare vector to all ws points
-                for n, wsp in enumerate(ws_list_norm):
-                    dist_wsp = np.absolute(np.sum(dists*wsp, axis=-1))
-                    if n == 0:
-                        nc_idx, nj_idx = np.where(
-                            dist_wsp <= (0.5*cutoff_scale + 0.001)
-                        )
-                        # Reindex dists to remove elements where the ion
-                        # is > halfway to WS point for efficiency
-                        dists = dists[nc_idx, nj_idx]
-                    else:
-                        # After first reindex, dists is now 1D so need
-                        # to reindex like this instead
-                        idx = np.where(
-                            dist_wsp <= (0.5*cutoff_scale + 0.001)
-                        )[0]
-                        nc_idx = nc_idx[idx]
-                        nj_idx = nj_idx[idx]
-                        dists = dists[idx]
-                    if len(nc_idx) == 0:
-                        break
-                    # If ion-ion vector has been < halfway to all WS
-                    # points, this is a valid image! Save it
-                    if n == len(ws_list_norm) - 1:
-                        n_im_idx = n_sc_images[nc_idx, i, nj_idx]
-                        sc_image_i[nc_idx, i, nj_idx, n_im_idx] = im
-                        n_sc_images[nc_idx, i, nj_idx] += 1
+                dist_wsp = np.absolute(np.matmul(ws_list_norm, dists))
+                # If ion-ion vector has been < halfway to all WS
+                # points, this is a valid image! Save it. Images are
+                # stored in order, so the position of each valid image is
+                # the number of valid images before it
+                valid = np.reshape(
+                    np.all(dist_wsp <= (0.5*cutoff_scale + 0.001), axis=0),
+                    (imf - imi, n_rij))
+                im_idx, rij_idx = np.where(valid)
+                n_im_idx = (n_rij_images[rij_idx]
+                            + np.cumsum(valid, axis=0)[im_idx, rij_idx] - 1)
+                sc_image_i[nc_of_rij[rij_idx], i, j_of_rij[rij_idx],
+                           n_im_idx] = imi + im_idx
+                n_rij_images += np.sum(valid, axis=0, dtype=np.int32)
+            n_sc_images[:, i, :] = np.reshape(n_rij_images,
+                                              (n_cells_in_sc, n_atoms))
 
         self._n_sc_images = n_sc_images
         # Truncate sc_image_i to the maximum ACTUAL images rather than
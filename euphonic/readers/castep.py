@@ -1,6 +1,9 @@
+import mmap
+import os
 import re
 import struct
-from typing import Dict, Any, TextIO, BinaryIO, Tuple, Optional, List, Union
+from typing import (Dict, Any, TextIO, Tuple, Optional, List, Union,
+                    Sequence)
 
 import numpy as np
 
@@ -365,40 +368,52 @@ def read_interpolation_data(
         'born_unit', 'dielectric' and 'dielectric_unit' if they are
         present in the .castep_bin or .check file.
     """
+    # Memory map the file and parse records from it directly, rather
+    # than making several small reads for each record, or reading the
+    # whole file into memory which may be large for big supercells
     with open(filename, 'rb') as f:
+        # An empty file can't be memory mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            raise EOFError(
+                'Problem reading binary file: unexpected EOF reached')
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with buf:
         int_type = '>i4'
         float_type = '>f8'
+        pos = 0
         header = ''
         first_cell_read = True
-        while header.strip() != b'END':
-            header = _read_entry(f)
-            if header.strip() == b'BEGIN_UNIT_CELL':
+        while header != b'END':
+            header, pos = _read_entry(buf, pos)
+            header = header.strip()
+            if header == b'BEGIN_UNIT_CELL':
                 # CASTEP writes the cell twice: the first is the
                 # geometry optimised cell, the second is the original
                 # cell. We only want the geometry optimised cell.
                 if first_cell_read:
                     (n_atoms, cell_vectors, atom_r, atom_mass,
-                    atom_type) = _read_cell(f, int_type, float_type)
+                     atom_type), pos = _read_cell(
+                         buf, pos, int_type, float_type)
                     first_cell_read = False
-            elif header.strip() == b'FORCE_CON':
-                sc_matrix = np.transpose(np.reshape(
-                    _read_entry(f, int_type), (3, 3)))
+            elif header == b'FORCE_CON':
+                sc_matrix, pos = _read_entry(buf, pos, int_type,
+                                             shape=(3, 3), axes=(1, 0))
                 n_cells_in_sc = int(np.rint(np.absolute(
                     np.linalg.det(sc_matrix))))
                 # Transpose and reshape fc so it is indexed [nc, i, j]
-                force_constants = np.ascontiguousarray(np.transpose(
-                    np.reshape(_read_entry(f, float_type),
-                               (n_cells_in_sc, 3*n_atoms, 3*n_atoms)),
-                    axes=[0, 2, 1]))
-                cell_origins = np.reshape(
-                    _read_entry(f, int_type), (n_cells_in_sc, 3))
-                fc_row = _read_entry(f, int_type)
-            elif header.strip() == b'BORN_CHGS':
-                born = np.reshape(
-                    _read_entry(f, float_type), (n_atoms, 3, 3))
-            elif header.strip() == b'DIELECTRIC':
-                dielectric = np.transpose(np.reshape(
-                    _read_entry(f, float_type), (3, 3)))
+                force_constants, pos = _read_entry(
+                    buf, pos, float_type,
+                    shape=(n_cells_in_sc, 3*n_atoms, 3*n_atoms),
+                    axes=(0, 2, 1))
+                cell_origins, pos = _read_entry(buf, pos, int_type,
+                                                shape=(n_cells_in_sc, 3))
+                fc_row, pos = _read_entry(buf, pos, int_type)
+            elif header == b'BORN_CHGS':
+                born, pos = _read_entry(buf, pos, float_type,
+                                        shape=(n_atoms, 3, 3))
+            elif header == b'DIELECTRIC':
+                dielectric, pos = _read_entry(buf, pos, float_type,
+                                              shape=(3, 3), axes=(1, 0))
 
     data_dict: Dict[str, Any] = {}
     data_dict['crystal'] = {}
@@ -440,16 +455,19 @@ def read_interpolation_data(
     return data_dict
 
 
-def _read_cell(file_obj: BinaryIO, int_type: str, float_type: str
-               ) -> Tuple[int, np.ndarray, np.ndarray,
-                          np.ndarray, np.ndarray]:
+def _read_cell(buf: mmap.mmap, pos: int, int_type: str, float_type: str
+               ) -> Tuple[Tuple[int, np.ndarray, np.ndarray,
+                                np.ndarray, np.ndarray], int]:
     """
     Read cell data from a .castep_bin or .check file
 
     Parameters
     ----------
-    file_obj
-        File object in read mode for the .castep_bin or .check file
+    buf
+        The memory mapped .castep_bin or .check file
+    pos
+        The byte offset in buf of the first record after the
+        'BEGIN_UNIT_CELL' header
     int_type
         Python struct format string describing the size and endian-ness
         of ints in the file
@@ -472,74 +490,79 @@ def _read_cell(file_obj: BinaryIO, int_type: str, float_type: str
     atom_type
         Shape (n_atoms,) string ndarray. The chemical symbols of each
         atom in the unit cell
+    pos
+        The byte offset in buf of the record after 'END_UNIT_CELL'
     """
     header = ''
-    while header.strip() != b'END_UNIT_CELL':
-        header = _read_entry(file_obj)
-        if header.strip() == b'CELL%NUM_IONS':
-            n_atoms = _read_entry(file_obj, int_type)
-        elif header.strip() == b'CELL%REAL_LATTICE':
-            cell_vectors = np.transpose(np.reshape(
-                _read_entry(file_obj, float_type), (3, 3)))
-        elif header.strip() == b'CELL%NUM_SPECIES':
-            n_species = _read_entry(file_obj, int_type)
-        elif header.strip() == b'CELL%NUM_IONS_IN_SPECIES':
-            n_atoms_in_species = _read_entry(file_obj, int_type)
+    while header != b'END_UNIT_CELL':
+        header, pos = _read_entry(buf, pos)
+        header = header.strip()
+        if header == b'CELL%NUM_IONS':
+            n_atoms, pos = _read_entry(buf, pos, int_type)
+        elif header == b'CELL%REAL_LATTICE':
+            cell_vectors, pos = _read_entry(buf, pos, float_type,
+                                            shape=(3, 3), axes=(1, 0))
+        elif header == b'CELL%NUM_SPECIES':
+            n_species, pos = _read_entry(buf, pos, int_type)
+        elif header == b'CELL%NUM_IONS_IN_SPECIES':
+            n_atoms_in_species, pos = _read_entry(buf, pos, int_type)
             if n_species == 1:
                 n_atoms_in_species = np.array([n_atoms_in_species])
-        elif header.strip() == b'CELL%IONIC_POSITIONS':
+        elif header == b'CELL%IONIC_POSITIONS':
             max_atoms_in_species = max(n_atoms_in_species)
-            atom_r_tmp = np.reshape(_read_entry(file_obj, float_type),
-                                   (n_species, max_atoms_in_species, 3))
-        elif header.strip() == b'CELL%SPECIES_MASS':
-            atom_mass_tmp = _read_entry(file_obj, float_type)
+            atom_r_tmp, pos = _read_entry(
+                buf, pos, float_type,
+                shape=(n_species, max_atoms_in_species, 3))
+        elif header == b'CELL%SPECIES_MASS':
+            atom_mass_tmp, pos = _read_entry(buf, pos, float_type)
             if n_species == 1:
                 atom_mass_tmp = np.array([atom_mass_tmp])
-        elif header.strip() == b'CELL%SPECIES_SYMBOL':
+        elif header == b'CELL%SPECIES_SYMBOL':
+            atom_type_tmp, pos = _read_entry(buf, pos, 'S8')
             # Need to decode binary string for Python 3 compatibility
             if n_species == 1:
-                atom_type_tmp = [_read_entry(file_obj, 'S8')
-                                .strip().decode('utf-8')]
+                atom_type_tmp = [atom_type_tmp.strip().decode('utf-8')]
             else:
                 atom_type_tmp = [x.strip().decode('utf-8')
-                                for x in _read_entry(file_obj, 'S8')]
+                                for x in atom_type_tmp]
     # Get atom_r in correct form
     # CASTEP stores atom positions as 3D array (3,
-    # max_atoms_in_species, n_species) so need to slice data to get
-    # correct information
-    atom_begin = np.insert(np.cumsum(n_atoms_in_species[:-1]), 0, 0)
-    atom_end = np.cumsum(n_atoms_in_species)
-    atom_r = np.zeros((n_atoms, 3))
-    for i in range(n_species):
-        atom_r[atom_begin[i]:atom_end[i], :] = atom_r_tmp[
-            i, :n_atoms_in_species[i], :]
-    # Get atom_type in correct form
-    atom_type = np.array([])
-    atom_mass = np.array([])
-    for at in range(n_species):
-        atom_type = np.append(
-            atom_type,
-            [atom_type_tmp[at] for i in range(n_atoms_in_species[at])])
-        atom_mass = np.append(
-            atom_mass,
-            [atom_mass_tmp[at] for i in range(n_atoms_in_species[at])])
-
-    return n_atoms, cell_vectors, atom_r, atom_mass, atom_type
-
-
-def _read_entry(file_obj: BinaryIO, dtype: str = ''
-                ) -> Union[str, int, float, np.ndarray]:
+    # max_atoms_in_species, n_species) so need to mask out the unused
+    # entries for species with fewer than max_atoms_in_species atoms
+    mask = (np.arange(max_atoms_in_species)[np.newaxis, :]
+            < n_atoms_in_species[:, np.newaxis])
+    atom_r = atom_r_tmp[mask]
+    # Get atom_type and atom_mass in correct form
+    atom_type = np.repeat(atom_type_tmp, n_atoms_in_species)
+    atom_mass = np.repeat(atom_mass_tmp, n_atoms_in_species)
+
+    return (n_atoms, cell_vectors, atom_r, atom_mass, atom_type), pos
+
+
+def _read_entry(buf: mmap.mmap, pos: int, dtype: str = '',
+                shape: Optional[Tuple[int, ...]] = None,
+                axes: Optional[Sequence[int]] = None
+                ) -> Tuple[Union[bytes, int, float, np.ndarray], int]:
     """
-    Read a record from a Fortran binary file, including the beginning
-    and end record markers and return the data inbetween
+    Read a record from the contents of a Fortran binary file, including
+    the beginning and end record markers and return the data inbetween
 
     Parameters
     ----------
-    f
-        File object in read mode for the Fortran binary file
+    buf
+        The memory mapped Fortran binary file
+    pos
+        The byte offset in buf of the beginning record marker
     dtype
         String determining what order and type to unpack the bytes as.
         See 'Format Strings' in Python struct documentation
+    shape
+        If the record contains an array, reshape it to this shape
+    axes
+        If the record contains an array, permute its axes after
+        reshaping, as in np.transpose. The byteswap to native-endian
+        and the transpose are done in a single copy, and the returned
+        array is C-contiguous
 
     Returns
     -------
@@ -548,38 +571,52 @@ def _read_entry(file_obj: BinaryIO, dtype: str = ''
         specified, return type is a string. If there is more than one
         element in the record, it is returned as an ndarray of floats or
         integers
+    pos
+        The byte offset in buf of the next record
 
     """
-    def record_mark_read(file_obj):
-        # Read 4 byte Fortran record marker
-        rawdata = file_obj.read(4)
-        if rawdata == b'':
-            raise EOFError(
-                'Problem reading binary file: unexpected EOF reached')
-        return struct.unpack('>i', rawdata)[0]
-
-    begin = record_mark_read(file_obj)
+    # Read 4 byte Fortran record marker
+    if pos + 4 > len(buf):
+        raise EOFError(
+            'Problem reading binary file: unexpected EOF reached')
+    begin = struct.unpack_from('>i', buf, pos)[0]
+    pos += 4
+    if pos + begin > len(buf):
+        raise EOFError(
+            'Problem reading binary file: unexpected EOF reached')
     if dtype:
         n_bytes = int(dtype[-1])
         n_elems = int(begin/n_bytes)
         if n_elems > 1:
-            data = np.fromfile(file_obj, dtype=dtype, count=n_elems)
+            data = np.frombuffer(buf, dtype=dtype, count=n_elems, offset=pos)
+            if shape is not None:
+                data = np.reshape(data, shape)
+            if axes is not None:
+                data = np.transpose(data, axes=axes)
+            # Always copy so the array doesn't refer to the file buffer
             if 'i' in dtype:
-                data = data.astype(np.int32)
+                data = np.array(data, dtype=np.int32, order='C')
             elif 'f' in dtype:
-                data = data.astype(np.float64)
+                data = np.array(data, dtype=np.float64, order='C')
+            else:
+                data = data.copy()
         else:
             if 'i' in dtype:
-                data = struct.unpack('>i', file_obj.read(begin))[0]
+                data = struct.unpack_from('>i', buf, pos)[0]
             elif 'f' in dtype:
-                data = struct.unpack('>d', file_obj.read(begin))[0]
+                data = struct.unpack_from('>d', buf, pos)[0]
             else:
-                data = file_obj.read(begin)
+                data = buf[pos:pos + begin]
     else:
-        data = file_obj.read(begin)
-    end = record_mark_read(file_obj)
+        data = buf[pos:pos + begin]
+    pos += begin
+    if pos + 4 > len(buf):
+        raise EOFError(
+            'Problem reading binary file: unexpected EOF reached')
+    end = struct.unpack_from('>i', buf, pos)[0]
+    pos += 4
     if begin != end:
         raise IOError("""Problem reading binary file: beginning and end
                          record markers do not match""")
 
-    return data
+    return data, pos
@@ -124,13 +124,11 @@ def get_all_origins(max_xyz: Tuple[int, int, int],
         Shape (prod(max_xyz - min_xyz)/step, 3) int ndarray. The cell
         origins
     """
-    diff = np.absolute(np.subtract(max_xyz, min_xyz))
-    nx = np.repeat(range(min_xyz[0], max_xyz[0], step), diff[1]*diff[2])
-    ny = np.repeat(np.tile(range(min_xyz[1], max_xyz[1], step), diff[0]),
-                   diff[2])
-    nz = np.tile(range(min_xyz[2], max_xyz[2], step), diff[0]*diff[1])
+    nx, ny, nz = np.meshgrid(
+        *[np.arange(min_xyz[i], max_xyz[i], step) for i in range(3)],
+        indexing='ij')
 
-    return np.column_stack((nx, ny, nz))
+    return np.stack((nx.ravel(), ny.ravel(), nz.ravel()), axis=1)
 
 
 def get_qpoint_labels(qpts: np.ndarray,
@@ -1,5 +1,6 @@
 import json
 import os
+from functools import lru_cache
 
 import pytest
 import numpy as np
@@ -102,6 +103,16 @@ def get_fc_path(*subpaths):
     return get_data_path('force_constants', *subpaths)
 
 
+@lru_cache(maxsize=None)
+def get_mode_widths(json_file):
+    # Mode widths files are loaded by many parametrised tests, so only
+    # read and parse each one once. The returned Quantity is shared, so
+    # must not be modified in-place
+    with open(get_fc_path(json_file), 'r') as fp:
+        modw_dict = json.load(fp)
+    return modw_dict['mode_widths']*ureg(modw_dict['mode_widths_unit'])
+
+
 def get_json_file(material):
     return get_fc_path(f'{material}_force_constants.json')
 
@@ -326,6 +337,16 @@ class TestForceConstantsCreation:
             ForceConstants.from_castep(
                 get_castep_path('h-BN', 'h-BN_no_force_constants.castep_bin'))
 
+    @pytest.mark.parametrize('truncate_frac', [0., 0.01, 0.5])
+    def test_create_from_truncated_castep_raises_eof_error(
+            self, truncate_frac, tmp_path):
+        with open(get_castep_path('quartz', 'quartz.castep_bin'), 'rb') as f:
+            data = f.read()
+        truncated_file = tmp_path / 'quartz.castep_bin'
+        truncated_file.write_bytes(data[:int(truncate_frac*len(data))])
+        with pytest.raises(EOFError):
+            ForceConstants.from_castep(str(truncated_file))
+
     @pytest.mark.phonopy_reader
     @pytest.mark.parametrize('material, phonopy_args', [
         ('CaHgO2', {'summary_name': 'mp-7041-20180417.yaml'})])
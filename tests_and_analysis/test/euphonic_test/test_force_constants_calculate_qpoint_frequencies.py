@@ -11,7 +11,7 @@ from tests_and_analysis.test.utils import (get_castep_path, get_test_qpts,
 from tests_and_analysis.test.euphonic_test.test_qpoint_frequencies import (
     check_qpt_freqs, get_expected_qpt_freqs)
 from tests_and_analysis.test.euphonic_test.test_force_constants import (
-    get_fc, get_fc_path)
+    get_fc, get_fc_path, get_mode_widths)
 
 
 class TestForceConstantsCalculateQPointFrequencies:
@@ -163,10 +163,7 @@ class TestForceConstantsCalculateQPointFrequencies:
             func_kwargs['n_threads'] = n_threads
         qpt_freqs, modw = fc.calculate_qpoint_frequencies(
             all_args[0], **func_kwargs)
-        with open(get_fc_path(expected_modw_file), 'r') as fp:
-            modw_dict = json.load(fp)
-        expected_modw = modw_dict['mode_widths']*ureg(
-            modw_dict['mode_widths_unit'])
+        expected_modw = get_mode_widths(expected_modw_file)
         expected_qpt_freqs = get_expected_qpt_freqs(
             material, expected_qpoint_frequencies_file)
         check_qpt_freqs(qpt_freqs,
@@ -15,7 +15,7 @@ from tests_and_analysis.test.utils import (get_data_path, get_phonopy_path,
 from tests_and_analysis.test.euphonic_test.test_qpoint_phonon_modes import (
     ExpectedQpointPhononModes, check_qpt_ph_modes, get_qpt_ph_modes_path)
 from tests_and_analysis.test.euphonic_test.test_force_constants import (
-    get_fc, get_fc_path)
+    get_fc, get_fc_path, get_mode_widths)
 
 
 class TestForceConstantsCalculateQPointPhononModes:
@@ -222,10 +222,7 @@ class TestForceConstantsCalculateQPointPhononModes:
             func_kwargs['n_threads'] = n_threads
         qpoint_phonon_modes, modw = fc.calculate_qpoint_phonon_modes(
             all_args[0], **func_kwargs)
-        with open(get_fc_path(expected_modw_file), 'r') as fp:
-            modw_dict = json.load(fp)
-        expected_modw = modw_dict['mode_widths']*ureg(
-                modw_dict['mode_widths_unit'])
+        expected_modw = get_mode_widths(expected_modw_file)
         expected_qpoint_phonon_modes = ExpectedQpointPhononModes(
             get_qpt_ph_modes_path(material, expected_qpoint_phonon_modes_file))
         check_qpt_ph_modes(qpoint_phonon_modes,
@@ -260,8 +257,8 @@ class TestForceConstantsCalculateQPointPhononModes:
         # Mock force constants to return nonsense gradients with high
         # imaginary terms
         class MockFC(ForceConstants):
-            def _calculate_phonons_at_q(self, *args):
-                freqs, evecs, grads = ForceConstants._calculate_phonons_at_q(
+            def _calculate_phonons_batch(self, *args):
+                freqs, evecs, grads = ForceConstants._calculate_phonons_batch(
                     self, *args)
                 mocked_grads = np.ones(grads.shape) + np.ones(grads.shape)*1j
                 return freqs, evecs, mocked_grads
@@ -283,6 +280,23 @@ class TestForceConstantsCalculateQPointPhononModes:
             get_test_qpts(), asr='realspace')
         check_qpt_ph_modes(qpt_ph_modes1, qpt_ph_modes2)
 
+    # Check stored values aren't reused after the force constants
+    # have been changed. Scaling the force constants by 4 should
+    # double the frequencies
+    @pytest.mark.parametrize('asr', [None, 'realspace'])
+    def test_calculate_qpoint_phonon_modes_after_setting_force_constants(
+            self, asr):
+        fc = ForceConstants.from_json_file(
+            get_fc_path('LZO_force_constants.json'))
+        qpt_ph_modes1 = fc.calculate_qpoint_phonon_modes(
+            get_test_qpts(), asr=asr)
+        fc.force_constants = 4*fc.force_constants
+        qpt_ph_modes2 = fc.calculate_qpoint_phonon_modes(
+            get_test_qpts(), asr=asr)
+        npt.assert_allclose(qpt_ph_modes2.frequencies.magnitude,
+                            2*qpt_ph_modes1.frequencies.magnitude,
+                            atol=1e-8)
+
     @pytest.mark.parametrize(
         'fc, material, qpt, kwargs, expected_qpt_ph_modes_file',
         [(get_fc('quartz'), 'quartz', np.array([[1., 1., 1.]]),
@@ -12,7 +12,7 @@ from euphonic.readers.phonopy import ImportPhonopyReaderError
 from tests_and_analysis.test.euphonic_test.test_crystal import (
     ExpectedCrystal, check_crystal)
 from tests_and_analysis.test.euphonic_test.test_force_constants import (
-    get_fc_path)
+    get_mode_widths)
 from tests_and_analysis.test.euphonic_test.test_spectrum1d import (
     get_expected_spectrum1d, check_spectrum1d)
 from tests_and_analysis.test.euphonic_test.test_spectrum1dcollection import (
@@ -81,6 +81,13 @@ class ExpectedQpointFrequencies:
 
         return (crystal, qpts, frequencies), kwargs
 
+
+# Energy bins of the quartz and LZO adaptive broadening reference data,
+# shared by the QpointFrequencies and QpointPhononModes DOS tests
+quartz_adaptive_ebins = np.arange(0, 155, 0.1)*ureg('meV')
+lzo_adaptive_ebins = np.arange(0, 100, 0.1)*ureg('meV')
+
+
 def get_qpt_freqs_path(*subpaths):
     return get_data_path('qpoint_frequencies', *subpaths)
 
@@ -428,11 +435,11 @@ class TestQpointFrequenciesCalculateDos:
             ('quartz', 'quartz_554_full_qpoint_frequencies.json',
              'quartz_554_full_mode_widths.json',
              'quartz_554_full_adaptive_dos.json',
-             np.arange(0, 155, 0.1)*ureg('meV')),
+             quartz_adaptive_ebins),
             ('LZO', 'lzo_222_full_qpoint_frequencies.json',
              'lzo_222_full_mode_widths.json',
              'lzo_222_full_adaptive_dos.json',
-             np.arange(0, 100, 0.1)*ureg('meV')),
+             lzo_adaptive_ebins),
             ('quartz', 'toy_quartz_qpoint_frequencies.json',
              'toy_quartz_mode_widths.json',
              'toy_quartz_uneven_adaptive_dos.json',
@@ -442,10 +449,7 @@ class TestQpointFrequenciesCalculateDos:
             self, material, qpt_freqs_json, mode_widths_json,
             expected_dos_json, ebins):
         qpt_freqs = get_qpt_freqs(material, qpt_freqs_json)
-        with open(get_fc_path(mode_widths_json), 'r') as fp:
-            modw_dict = json.load(fp)
-        mode_widths = modw_dict['mode_widths']*ureg(
-            modw_dict['mode_widths_unit'])
+        mode_widths = get_mode_widths(mode_widths_json)
         dos = qpt_freqs.calculate_dos(
             ebins, mode_widths=mode_widths)
         expected_dos = get_expected_spectrum1d(expected_dos_json)
@@ -457,19 +461,16 @@ class TestQpointFrequenciesCalculateDos:
             ('LZO', 'lzo_222_full_qpoint_frequencies.json',
              'lzo_222_full_mode_widths.json',
               5*ureg('meV'),
-             np.arange(0, 100, 0.1)*ureg('meV')),
+             lzo_adaptive_ebins),
             ('LZO', 'lzo_222_full_qpoint_frequencies.json',
              'lzo_222_full_mode_widths.json',
              2e-4*ureg('hartree'),
-             np.arange(0, 100, 0.1)*ureg('meV'))])
+             lzo_adaptive_ebins)])
     def test_calculate_dos_with_mode_widths_min(
             self, material, qpt_freqs_json, mode_widths_json,
             mode_widths_min, ebins):
         qpt_freqs = get_qpt_freqs(material, qpt_freqs_json)
-        with open(get_fc_path(mode_widths_json), 'r') as fp:
-            modw_dict = json.load(fp)
-        mode_widths = modw_dict['mode_widths']*ureg(
-            modw_dict['mode_widths_unit'])
+        mode_widths = get_mode_widths(mode_widths_json)
         dos = qpt_freqs.calculate_dos(ebins, mode_widths=mode_widths,
                                       mode_widths_min=mode_widths_min)
         mode_widths = np.maximum(
@@ -11,11 +11,12 @@ from euphonic.readers.phonopy import ImportPhonopyReaderError
 from tests_and_analysis.test.euphonic_test.test_crystal import (
     ExpectedCrystal, get_crystal, check_crystal)
 from tests_and_analysis.test.euphonic_test.test_force_constants import (
-    get_fc_path)
+    get_mode_widths)
 from tests_and_analysis.test.euphonic_test.test_debye_waller import (
     get_expected_dw, check_debye_waller)
 from tests_and_analysis.test.euphonic_test.test_qpoint_frequencies import (
-    get_expected_qpt_freqs, check_qpt_freqs)
+    get_expected_qpt_freqs, check_qpt_freqs, quartz_adaptive_ebins,
+    lzo_adaptive_ebins)
 from tests_and_analysis.test.euphonic_test.test_spectrum1d import (
     get_expected_spectrum1d, check_spectrum1d)
 from tests_and_analysis.test.euphonic_test.test_spectrum1dcollection import (
@@ -541,15 +542,12 @@ class TestQpointPhononModesCalculateDos:
             ('quartz', 'quartz_554_full_qpoint_phonon_modes.json',
              'quartz_554_full_mode_widths.json',
              'quartz_554_full_adaptive_dos.json',
-             np.arange(0, 155, 0.1)*ureg('meV'))])
+             quartz_adaptive_ebins)])
     def test_calculate_dos_with_mode_widths(
             self, material, qpt_ph_modes_json, mode_widths_json,
             expected_dos_json, ebins):
         qpt_ph_modes = get_qpt_ph_modes_from_json(material, qpt_ph_modes_json)
-        with open(get_fc_path(mode_widths_json), 'r') as fp:
-            modw_dict = json.load(fp)
-        mode_widths = modw_dict['mode_widths']*ureg(
-            modw_dict['mode_widths_unit'])
+        mode_widths = get_mode_widths(mode_widths_json)
         dos = qpt_ph_modes.calculate_dos(
             ebins, mode_widths=mode_widths)
         expected_dos = get_expected_spectrum1d(expected_dos_json)
@@ -561,15 +559,12 @@ class TestQpointPhononModesCalculateDos:
             ('LZO', 'lzo_222_full_qpoint_phonon_modes.json',
              'lzo_222_full_mode_widths.json',
              2e-4*ureg('hartree'),
-             np.arange(0, 100, 0.1)*ureg('meV'))])
+             lzo_adaptive_ebins)])
     def test_calculate_dos_with_mode_widths_min(
             self, material, qpt_ph_modes_json, mode_widths_json,
             mode_widths_min, ebins):
         qpt_ph_modes = get_qpt_ph_modes_from_json(material, qpt_ph_modes_json)
-        with open(get_fc_path(mode_widths_json), 'r') as fp:
-            modw_dict = json.load(fp)
-        mode_widths = modw_dict['mode_widths']*ureg(
-            modw_dict['mode_widths_unit'])
+        mode_widths = get_mode_widths(mode_widths_json)
         dos = qpt_ph_modes.calculate_dos(ebins, mode_widths=mode_widths,
                                       mode_widths_min=mode_widths_min)
         mode_widths = np.maximum(
@@ -628,10 +623,7 @@ class TestQpointPhononModesCalculatePdos:
             self, material, qpt_ph_modes_json, mode_widths_json,
             expected_pdos_json, ebins):
         qpt_ph_modes = get_qpt_ph_modes_from_json(material, qpt_ph_modes_json)
-        with open(get_fc_path(mode_widths_json), 'r') as fp:
-            modw_dict = json.load(fp)
-        mode_widths = modw_dict['mode_widths']*ureg(
-            modw_dict['mode_widths_unit'])
+        mode_widths = get_mode_widths(mode_widths_json)
         pdos = qpt_ph_modes.calculate_pdos(
             ebins, mode_widths=mode_widths, weighting='coherent')
         expected_pdos = get_expected_spectrum1dcollection(expected_pdos_json)
@@ -656,16 +648,13 @@ class TestQpointPhononModesCalculatePdos:
             ('quartz', 'quartz_554_full_qpoint_phonon_modes.json',
              'quartz_554_full_mode_widths.json',
              'quartz_554_full_adaptive_dos.json',
-             np.arange(0, 155, 0.1)*ureg('meV'))
+             quartz_adaptive_ebins)
         ])
     def test_total_dos_from_pdos_same_as_calculate_dos_with_mode_widths(
             self, material, qpt_ph_modes_json, mode_widths_json,
             expected_dos_json, ebins):
         qpt_ph_modes = get_qpt_ph_modes_from_json(material, qpt_ph_modes_json)
-        with open(get_fc_path(mode_widths_json), 'r') as fp:
-            modw_dict = json.load(fp)
-        mode_widths = modw_dict['mode_widths']*ureg(
-            modw_dict['mode_widths_unit'])
+        mode_widths = get_mode_widths(mode_widths_json)
         summed_pdos = qpt_ph_modes.calculate_pdos(
             ebins, mode_widths=mode_widths).sum()
         expected_total_dos = get_expected_spectrum1d(expected_dos_json)
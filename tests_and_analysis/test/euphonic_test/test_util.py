@@ -7,11 +7,11 @@ import numpy.testing as npt
 
 from euphonic import ureg
 from euphonic.util import (direction_changed, mp_grid, get_qpoint_labels,
-                           mode_gradients_to_widths)
+                           mode_gradients_to_widths, get_all_origins)
 from tests_and_analysis.test.utils import get_data_path
 from tests_and_analysis.test.euphonic_test.test_crystal import get_crystal
 from tests_and_analysis.test.euphonic_test.test_force_constants import (
-    get_fc_path)
+    get_fc_path, get_mode_widths)
 
 
 class TestDirectionChanged:
@@ -39,6 +39,21 @@ class TestMPGrid:
         npt.assert_equal(qpts, expected_qpts)
 
 
+class TestGetAllOrigins:
+
+    @pytest.mark.parametrize('max_xyz, kwargs, expected_origins', [
+        ((2, 1, 2), {},
+         [[0, 0, 0], [0, 0, 1], [1, 0, 0], [1, 0, 1]]),
+        ((1, 2, 1), {'min_xyz': (-1, 0, 0)},
+         [[-1, 0, 0], [-1, 1, 0], [0, 0, 0], [0, 1, 0]]),
+        ((4, 1, 3), {'min_xyz': (0, 0, -2), 'step': 2},
+         [[0, 0, -2], [0, 0, 0], [0, 0, 2],
+          [2, 0, -2], [2, 0, 0], [2, 0, 2]])])
+    def test_get_all_origins(self, max_xyz, kwargs, expected_origins):
+        origins = get_all_origins(max_xyz, **kwargs)
+        npt.assert_equal(origins, expected_origins)
+
+
 class TestGetQptLabels:
 
     @pytest.mark.parametrize('qpts, kwargs, expected_labels', [
@@ -96,10 +111,7 @@ class TestModeGradientsToWidths:
     def test_mode_gradients_to_widths(self, mode_grads, cell_vecs,
                                       expected_mode_widths_file):
         mode_widths = mode_gradients_to_widths(mode_grads, cell_vecs)
-        with open(get_fc_path(expected_mode_widths_file), 'r') as fp:
-            modw_dict = json.load(fp)
-        expected_mode_widths = modw_dict['mode_widths']*ureg(
-            modw_dict['mode_widths_unit'])
+        expected_mode_widths = get_mode_widths(expected_mode_widths_file)
         assert mode_widths.units == expected_mode_widths.units
         npt.assert_allclose(mode_widths.magnitude,
                             expected_mode_widths.magnitude, atol=3e-4)
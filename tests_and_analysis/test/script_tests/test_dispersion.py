@@ -2,22 +2,24 @@ import sys
 import os
 import json
 from unittest.mock import patch
-from platform import platform
 
 import pytest
+import numpy as np
 import numpy.testing as npt
-from packaging import version
-from scipy import __version__ as scipy_ver
 
 from tests_and_analysis.test.utils import (
     get_data_path, get_castep_path, get_phonopy_path)
 from tests_and_analysis.test.script_tests.utils import (
-    get_script_test_data_path, get_current_plot_line_data, args_to_key)
+    get_script_test_data_path, get_current_plot_line_data, args_to_key,
+    skip_on_macos_segfault)
 
 pytestmark = pytest.mark.matplotlib
 # Allow tests with matplotlib marker to be collected and
 # deselected if Matplotlib is not installed
 try:
+    import matplotlib
+    # Use a non-interactive backend, the figures are only inspected
+    matplotlib.use('Agg')
     import matplotlib.pyplot
     import euphonic.cli.dispersion
 except ModuleNotFoundError:
@@ -68,17 +70,28 @@ class TestRegression:
         mocker.patch('matplotlib.pyplot.show')
         mocker.resetall()
 
+    @pytest.fixture(scope='class')
+    def expected_data(self):
+        # The expected data for all parametrisations is in a single
+        # file, so only read and parse it once for the whole class
+        with open(disp_output_file, 'r') as f:
+            return json.load(f)
+
     def teardown_method(self):
-        # Ensure figures are closed
-        matplotlib.pyplot.close('all')
+        # Ensure figures are closed. If the test stored the figure it
+        # created only close that, rather than all figures
+        if hasattr(self, '_fig'):
+            matplotlib.pyplot.close(self._fig)
+        else:
+            matplotlib.pyplot.close('all')
 
-    def run_dispersion_and_test_result(self, dispersion_args):
+    def run_dispersion_and_test_result(self, dispersion_args, expected_data):
         euphonic.cli.dispersion.main(dispersion_args)
 
+        self._fig = matplotlib.pyplot.gcf()
         line_data = get_current_plot_line_data()
 
-        with open(disp_output_file, 'r') as f:
-            expected_line_data = json.load(f)[args_to_key(dispersion_args)]
+        expected_line_data = expected_data[args_to_key(dispersion_args)]
         # Increase tolerance if asr present - can give slightly
         # different results with different libs
         if any(['--asr' in arg for arg in dispersion_args]):
@@ -87,36 +100,39 @@ class TestRegression:
             atol = sys.float_info.epsilon
         for key, value in line_data.items():
             if key == 'xy_data':
-                # numpy can only auto convert 2D lists - xy_data has
-                # dimensions (n_lines, 2, n_points) so check in a loop
-                for idx, line in enumerate(value):
+                # xy_data has dimensions (n_lines, 2, n_points). If all
+                # lines have the same number of points compare them all
+                # at once, otherwise check each line in a loop
+                if len({len(line[0]) for line in value}) == 1:
                     npt.assert_allclose(
-                        line, expected_line_data[key][idx],
+                        np.array(value), np.array(expected_line_data[key]),
                         atol=atol)
+                else:
+                    for idx, line in enumerate(value):
+                        npt.assert_allclose(
+                            line, expected_line_data[key][idx],
+                            atol=atol)
             else:
                 assert value == expected_line_data[key]
 
 
     @pytest.mark.parametrize('dispersion_args', disp_params)
-    def test_dispersion_plot_data(self, inject_mocks, dispersion_args):
-        self.run_dispersion_and_test_result(dispersion_args)
+    def test_dispersion_plot_data(
+            self, inject_mocks, expected_data, dispersion_args):
+        self.run_dispersion_and_test_result(dispersion_args, expected_data)
 
     @pytest.mark.phonopy_reader
     @pytest.mark.parametrize('dispersion_args', disp_params_from_phonopy)
     def test_dispersion_plot_data_from_phonopy(
-            self, inject_mocks, dispersion_args):
-        self.run_dispersion_and_test_result(dispersion_args)
+            self, inject_mocks, expected_data, dispersion_args):
+        self.run_dispersion_and_test_result(dispersion_args, expected_data)
 
     @pytest.mark.phonopy_reader
     @pytest.mark.parametrize('dispersion_args', disp_params_macos_segfault)
-    @pytest.mark.skipif(
-        (any([s in platform() for s in ['Darwin', 'macOS']])
-         and version.parse(scipy_ver) > version.parse('1.1.0')),
-        reason=('Segfaults on some MacOS platforms with Scipy > 1.1.0, may '
-                'be related to https://github.com/google/jax/issues/432'))
+    @skip_on_macos_segfault
     def test_dispersion_plot_data_macos_segfault(
-            self, inject_mocks, dispersion_args):
-        self.run_dispersion_and_test_result(dispersion_args)
+            self, inject_mocks, expected_data, dispersion_args):
+        self.run_dispersion_and_test_result(dispersion_args, expected_data)
 
     @pytest.mark.parametrize('dispersion_args', [
         [quartz_json_file, '--save-to'],
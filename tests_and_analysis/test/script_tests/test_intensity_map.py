@@ -1,21 +1,22 @@
 import os
 import json
 from unittest.mock import patch
-from platform import platform
 
 import pytest
 import numpy.testing as npt
-from packaging import version
-from scipy import __version__ as scipy_ver
 
 from tests_and_analysis.test.utils import get_data_path, get_castep_path
 from tests_and_analysis.test.script_tests.utils import (
-    get_script_test_data_path, get_current_plot_image_data, args_to_key)
+    get_script_test_data_path, get_current_plot_image_data, args_to_key,
+    skip_on_macos_segfault)
 
 pytestmark = pytest.mark.matplotlib
 # Allow tests with matplotlib marker to be collected and
 # deselected if Matplotlib is not installed
 try:
+    import matplotlib
+    # Use a non-interactive backend, the figures are only inspected
+    matplotlib.use('Agg')
     import matplotlib.pyplot
     import euphonic.cli.intensity_map
 except ModuleNotFoundError:
@@ -63,22 +64,33 @@ class TestRegression:
         mocker.patch('matplotlib.pyplot.show')
         mocker.resetall()
 
+    @pytest.fixture(scope='class')
+    def expected_data(self):
+        # The expected data for all parametrisations is in a single
+        # file, so only read and parse it once for the whole class
+        with open(intensity_map_output_file, 'r') as f:
+            return json.load(f)
+
     def teardown_method(self):
-        # Ensure figures are closed
-        matplotlib.pyplot.close('all')
+        # Ensure figures are closed. If the test stored the figure it
+        # created only close that, rather than all figures
+        if hasattr(self, '_fig'):
+            matplotlib.pyplot.close(self._fig)
+        else:
+            matplotlib.pyplot.close('all')
 
     def run_intensity_map_and_test_result(
-            self, intensity_map_args):
+            self, intensity_map_args, expected_data):
         euphonic.cli.intensity_map.main(intensity_map_args)
 
-        matplotlib.pyplot.gcf().tight_layout()  # Force tick labels to be set
+        self._fig = matplotlib.pyplot.gcf()
+        self._fig.tight_layout()  # Force tick labels to be set
         image_data = get_current_plot_image_data()
 
-        with open(intensity_map_output_file, 'r') as expected_data_file:
-            # Test deprecated --weights until it is removed
-            key = args_to_key(intensity_map_args).replace(
-                'weights', 'weighting')
-            expected_image_data = json.load(expected_data_file)[key]
+        # Test deprecated --weights until it is removed
+        key = args_to_key(intensity_map_args).replace(
+            'weights', 'weighting')
+        expected_image_data = expected_data[key]
         for key, value in image_data.items():
             if key == 'extent':
                 # Lower bound of y-data (energy) varies by up to ~2e-6 on
@@ -96,19 +108,17 @@ class TestRegression:
 
     @pytest.mark.parametrize('intensity_map_args', intensity_map_params)
     def test_intensity_map_image_data(
-            self, inject_mocks, intensity_map_args):
-        self.run_intensity_map_and_test_result(intensity_map_args)
+            self, inject_mocks, expected_data, intensity_map_args):
+        self.run_intensity_map_and_test_result(
+            intensity_map_args, expected_data)
 
     @pytest.mark.parametrize(
         'intensity_map_args', intensity_map_params_macos_segfault)
-    @pytest.mark.skipif(
-        (any([s in platform() for s in ['Darwin', 'macOS']])
-         and version.parse(scipy_ver) > version.parse('1.1.0')),
-        reason=('Segfaults on some MacOS platforms with Scipy > 1.1.0, may '
-                'be related to https://github.com/google/jax/issues/432'))
+    @skip_on_macos_segfault
     def test_intensity_map_image_data_macos_segfault(
-            self, inject_mocks, intensity_map_args):
-        self.run_intensity_map_and_test_result(intensity_map_args)
+            self, inject_mocks, expected_data, intensity_map_args):
+        self.run_intensity_map_and_test_result(
+            intensity_map_args, expected_data)
 
     @pytest.mark.parametrize('intensity_map_args', [
         [quartz_json_file, '--save-to'],
@@ -1,13 +1,28 @@
 import os
+from platform import platform
 # Required for mocking
 try:
     import matplotlib.pyplot
 except ModuleNotFoundError:
     pass
 from typing import Dict, List, Union, Tuple
+
+import pytest
+from packaging import version
+from scipy import __version__ as scipy_ver
+
 from ..utils import get_data_path
 
 
+# Mark for tests that segfault on some MacOS platforms, shared by the
+# script tests so the platform and version checks are only done once
+skip_on_macos_segfault = pytest.mark.skipif(
+    (any([s in platform() for s in ['Darwin', 'macOS']])
+     and version.parse(scipy_ver) > version.parse('1.1.0')),
+    reason=('Segfaults on some MacOS platforms with Scipy > 1.1.0, may '
+            'be related to https://github.com/google/jax/issues/432'))
+
+
 def args_to_key(cl_args: str) -> str:
     """
     From CL tool arguments, return the key that should be used to store